@@ -5,6 +5,7 @@ import datetime
 from datetime import timedelta
 import logging
 
+from aiohttp import ClientSession
 from defusedxml.ElementTree import fromstring
 from requests import RequestException
 
@@ -27,24 +28,22 @@ from .const import Commands
 _LOGGER = logging.getLogger(__name__)
 
 
-class MicroAirCoordinatorHub(update_coordinator.DataUpdateCoordinator[None]):
-    """Implementation of API."""
+async def async_get_short_status(session: ClientSession, ip_addr: str) -> str | None:
+    """Post to /ShortStatus and return the body, or None on a non 200 reply."""
+    url = "http://" + ip_addr + "/ShortStatus"
+    async with session.post(url) as resp:
+        if resp.status != 200:
+            return None
 
-    def __init__(self, hass: HomeAssistant, ip_address: str, name: str) -> None:
-        """Initialize."""
-        super().__init__(
-            hass,
-            _LOGGER,
-            name=name,
-            update_interval=timedelta(seconds=30),
-        )
+        x = await resp.content.read()
+        return x.decode("utf8")
 
-        self.last_update_success = False
 
-        self._ip_addr = ip_address
-        self._session = async_get_clientsession(hass)
+class MicroAirStatus:
+    """Decoded thermostat state, kept apart from Home Assistant for reuse."""
 
-        # Setup properties
+    def __init__(self) -> None:
+        """Initialize."""
         self._line_voltage = 240
         self._hvac_mode = HVACMode.OFF
         self._hvac_action = HVACAction.IDLE
@@ -55,74 +54,6 @@ class MicroAirCoordinatorHub(update_coordinator.DataUpdateCoordinator[None]):
         self._current_humidity = 0
         self._my_network_id = ""
 
-        self._next_setpoint_sync = datetime.datetime.now()
-        self._handle_setpoint_sync = asyncio.create_task(
-            self._async_desired_setpoint_push_delayed(False)
-        )
-
-    async def test_connection(self, ip_addr: str):
-        """Test the connection to the thermostat by posting to get the status."""
-        url = "http://" + ip_addr + "/ShortStatus"
-
-        resp = await self._session.post(url)
-        if resp.status != 200:
-            self.last_update_success = False
-            return False
-
-        return True
-
-    async def _async_transmit_data(self, cmd_string):
-        try:
-            url = "http://" + self._ip_addr + "/Transmission"
-            final_cmd = cmd_string.replace("xx", self._my_network_id)
-            resp = await self._session.post(url, data=final_cmd)
-            if resp.status != 200:
-                self.last_update_success = False
-                return False
-
-            x = await resp.content.read()
-            content = x.decode("utf8")
-            # print(content)
-            success = "<X>OK</X>" in content
-            if success:
-                self.last_update_success = True
-                _LOGGER.info(
-                    "Successfully sent command %s to %s at device ID %s",
-                    final_cmd,
-                    self.name,
-                    self._my_network_id,
-                )
-        except (OSError, RequestException) as ex:
-            raise update_coordinator.UpdateFailed(
-                f"Exception during MicroAir Climate info update: {ex}"
-            ) from ex
-
-    async def _async_update_data(self) -> None:
-        """Update the state."""
-        _LOGGER.info("Updating state for %s", self.name)
-        try:
-            url = "http://" + self._ip_addr + "/ShortStatus"
-            resp = await self._session.post(url)
-
-            if resp.status != 200:
-                self.last_update_success = False
-                return
-
-            x = await resp.content.read()
-            content = x.decode("utf8")
-            # print(content)
-            await self.update_data_from_xml(content)
-            self.last_update_success = True
-
-        except (OSError, RequestException) as ex:
-            raise update_coordinator.UpdateFailed(
-                f"Exception during MicroAir Climate info update: {ex}"
-            ) from ex
-
-    async def force_update(self):
-        """Update immediately."""
-        await self._async_update_data()
-
     @property
     def hvac_mode(self):
         """Get the mode of the thermostat."""
@@ -163,23 +94,6 @@ class MicroAirCoordinatorHub(update_coordinator.DataUpdateCoordinator[None]):
         """Return the line voltage."""
         return self._line_voltage
 
-    async def async_set_fan_mode(self, mode: str):
-        """Set the fan mode, transmit update."""
-        return
-
-    async def async_set_hvac_mode(self, mode: HVACMode):
-        """Make http call and set mode."""
-        if mode == HVACMode.OFF:
-            await self._async_transmit_data(Commands.COMMAND_SET_HVAC_MODE_OFF)
-        elif mode == HVACMode.COOL:
-            await self._async_transmit_data(Commands.COMMAND_SET_HVAC_MODE_COOL)
-        elif mode == HVACMode.HEAT:
-            await self._async_transmit_data(Commands.COMMAND_SET_HVAC_MODE_HEAT)
-        elif mode == HVACMode.AUTO:
-            await self._async_transmit_data(Commands.COMMAND_SET_HVAC_MODE_AUTO)
-        elif mode == HVACMode.DRY:
-            await self._async_transmit_data(Commands.COMMAND_SET_HVAC_MODE_DRY)
-
     async def update_data_from_xml(self, x):
         """Parse out xml and map properties."""
         xml = fromstring(x)
@@ -264,6 +178,122 @@ class MicroAirCoordinatorHub(update_coordinator.DataUpdateCoordinator[None]):
             self._fan_state = FAN_HIGH
             self._fan_mode = FAN_AUTO
 
+    def as_dict(self) -> dict:
+        """Return the decoded state as a plain dict."""
+        return {
+            "hvac_mode": self.hvac_mode,
+            "hvac_action": self.hvac_action,
+            "fan_mode": self.fan_mode,
+            "fan_state": self.fanstate,
+            "setpoint": self.setpoint,
+            "indoor_temp": self.indoor_temp,
+            "indoor_humidity": self.indoor_humidity,
+            "line_voltage": self.line_voltage,
+            "network_id": self._my_network_id,
+        }
+
+
+class MicroAirCoordinatorHub(
+    update_coordinator.DataUpdateCoordinator[None], MicroAirStatus
+):
+    """Implementation of API."""
+
+    def __init__(self, hass: HomeAssistant, ip_address: str, name: str) -> None:
+        """Initialize."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=name,
+            update_interval=timedelta(seconds=30),
+        )
+
+        self.last_update_success = False
+
+        self._ip_addr = ip_address
+        self._session = async_get_clientsession(hass)
+
+        # Setup properties
+        MicroAirStatus.__init__(self)
+
+        self._next_setpoint_sync = datetime.datetime.now()
+        self._handle_setpoint_sync = asyncio.create_task(
+            self._async_desired_setpoint_push_delayed(False)
+        )
+
+    async def test_connection(self, ip_addr: str):
+        """Test the connection to the thermostat by posting to get the status."""
+        if await async_get_short_status(self._session, ip_addr) is None:
+            self.last_update_success = False
+            return False
+
+        return True
+
+    async def _async_transmit_data(self, cmd_string):
+        try:
+            url = "http://" + self._ip_addr + "/Transmission"
+            final_cmd = cmd_string.replace("xx", self._my_network_id)
+            resp = await self._session.post(url, data=final_cmd)
+            if resp.status != 200:
+                self.last_update_success = False
+                return False
+
+            x = await resp.content.read()
+            content = x.decode("utf8")
+            # print(content)
+            success = "<X>OK</X>" in content
+            if success:
+                self.last_update_success = True
+                _LOGGER.info(
+                    "Successfully sent command %s to %s at device ID %s",
+                    final_cmd,
+                    self.name,
+                    self._my_network_id,
+                )
+        except (OSError, RequestException) as ex:
+            raise update_coordinator.UpdateFailed(
+                f"Exception during MicroAir Climate info update: {ex}"
+            ) from ex
+
+    async def _async_update_data(self) -> None:
+        """Update the state."""
+        _LOGGER.info("Updating state for %s", self.name)
+        try:
+            content = await async_get_short_status(self._session, self._ip_addr)
+
+            if content is None:
+                self.last_update_success = False
+                return
+
+            # print(content)
+            await self.update_data_from_xml(content)
+            self.last_update_success = True
+
+        except (OSError, RequestException) as ex:
+            raise update_coordinator.UpdateFailed(
+                f"Exception during MicroAir Climate info update: {ex}"
+            ) from ex
+
+    async def force_update(self):
+        """Update immediately."""
+        await self._async_update_data()
+
+    async def async_set_fan_mode(self, mode: str):
+        """Set the fan mode, transmit update."""
+        return
+
+    async def async_set_hvac_mode(self, mode: HVACMode):
+        """Make http call and set mode."""
+        if mode == HVACMode.OFF:
+            await self._async_transmit_data(Commands.COMMAND_SET_HVAC_MODE_OFF)
+        elif mode == HVACMode.COOL:
+            await self._async_transmit_data(Commands.COMMAND_SET_HVAC_MODE_COOL)
+        elif mode == HVACMode.HEAT:
+            await self._async_transmit_data(Commands.COMMAND_SET_HVAC_MODE_HEAT)
+        elif mode == HVACMode.AUTO:
+            await self._async_transmit_data(Commands.COMMAND_SET_HVAC_MODE_AUTO)
+        elif mode == HVACMode.DRY:
+            await self._async_transmit_data(Commands.COMMAND_SET_HVAC_MODE_DRY)
+
     async def async_set_setpoint(self, setpoint):
         """Set the setpoint."""
         # Convert setpoint to hex and transmit setting string.
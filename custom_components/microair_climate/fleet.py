@@ -0,0 +1,360 @@
+"""Headless poller for a fleet of MicroAir thermostats.
+
+Polls /ShortStatus on many thermostats without running Home Assistant and
+streams the decoded state as JSON lines on stdout. A summary of throughput and
+latency percentiles is written to stderr on exit.
+
+    python -m custom_components.microair_climate.fleet 192.168.1.0/24 -c 16
+
+Targets may be single addresses, CIDR blocks or host:port pairs ([v6]:port for
+IPv6), so a local stand-in server (e.g. 127.0.0.1:8080) can be polled for
+offline testing. Latency percentiles cover successful requests only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import ipaddress
+import json
+import logging
+import math
+import os
+import signal
+import sys
+import time
+
+from aiohttp import ClientError, ClientSession, ClientTimeout
+
+from .const import REQUEST_TIMEOUT, UPDATE_INTERVAL
+from .coordinator import MicroAirStatus, async_get_short_status
+
+_LOGGER = logging.getLogger(__name__)
+
+# Largest CIDR block that will be expanded, 65536 addresses is an IPv6 /112.
+MAX_CIDR_ADDRESSES = 65536
+
+
+def _format_host(host: str, port: int | None) -> str:
+    """Return host[:port] ready for a URL, bracketing IPv6 literals."""
+    try:
+        addr = ipaddress.ip_address(host)
+    except ValueError:
+        addr = None
+
+    if addr is not None and addr.version == 6:
+        if addr.scope_id:
+            raise ValueError(f"scoped IPv6 address '{host}' is not supported")
+        host = f"[{host}]"
+
+    if port is None:
+        return host
+    if not 0 < port < 65536:
+        raise ValueError(f"port {port} is out of range")
+    return f"{host}:{port}"
+
+
+def _parse_target(target: str, port: int | None) -> str:
+    """Parse an address, [IPv6]:port or host:port into host[:port]."""
+    try:
+        addr = ipaddress.ip_address(target)
+    except ValueError:
+        pass
+    else:
+        return _format_host(str(addr), port)
+
+    if target.startswith("[") and target.endswith("]"):
+        return _format_host(str(ipaddress.ip_address(target[1:-1])), port)
+
+    host, sep, target_port = target.rpartition(":")
+    if not sep:
+        return _format_host(target, port)
+
+    if host.startswith("[") and host.endswith("]"):
+        host = str(ipaddress.ip_address(host[1:-1]))
+    elif ":" in host or not host:
+        raise ValueError(f"'{target}' is not a valid target")
+
+    try:
+        return _format_host(host, int(target_port))
+    except ValueError as ex:
+        raise ValueError(f"'{target}' is not a valid target: {ex}") from ex
+
+
+def expand_targets(targets: list[str], port: int | None = None) -> list[str]:
+    """Expand addresses and CIDR blocks into a list of host[:port] strings.
+
+    A port given in the target itself takes precedence over port.
+    """
+    hosts = []
+    for target in targets:
+        if "/" not in target:
+            hosts.append(_parse_target(target, port))
+            continue
+
+        network = ipaddress.ip_network(target, strict=False)
+        if network.num_addresses > MAX_CIDR_ADDRESSES:
+            raise ValueError(
+                f"'{target}' has {network.num_addresses} addresses,"
+                f" at most {MAX_CIDR_ADDRESSES} can be polled"
+            )
+        addrs = list(network.hosts()) or [network.network_address]
+        hosts.extend(_format_host(str(addr), port) for addr in addrs)
+
+    return hosts
+
+
+def _stdout_open() -> bool:
+    """Return False once the stdout reader has gone away."""
+    try:
+        sys.stdout.flush()
+    except BrokenPipeError:
+        return False
+    return True
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class FleetPoller:
+    """Poll a set of thermostats from a fixed pool of workers."""
+
+    def __init__(
+        self,
+        session: ClientSession,
+        hosts: list[str],
+        concurrency: int,
+        interval: float,
+        count: int,
+        out=sys.stdout,
+    ) -> None:
+        """Initialize."""
+        self._session = session
+        self._hosts = hosts
+        self._workers = max(min(concurrency, len(hosts)), 1)
+        self._interval = interval
+        self._count = count
+        self._out = out
+        self._stop = asyncio.Event()
+        self._queue: asyncio.Queue[tuple[str, int] | None] = asyncio.Queue()
+        self._statuses: dict[str, MicroAirStatus] = {}
+        self._active = len(hosts)
+
+        self.latencies: list[float] = []
+        self.requests = 0
+        self.errors = 0
+
+    def stop(self) -> None:
+        """Ask the workers to finish after their current request."""
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        for _ in range(self._workers):
+            self._queue.put_nowait(None)
+
+    def _requeue(self, job: tuple[str, int]) -> None:
+        """Put a host back in line for its next poll."""
+        if not self._stop.is_set():
+            self._queue.put_nowait(job)
+
+    async def _async_poll_once(self, host: str) -> dict:
+        """Poll one thermostat and return a JSON ready record."""
+        status = self._statuses.setdefault(host, MicroAirStatus())
+        record = {"host": host, "ts": time.time()}
+        start = time.perf_counter()
+        try:
+            content = await async_get_short_status(self._session, host)
+        except (OSError, ClientError, asyncio.TimeoutError, ValueError) as ex:
+            # ValueError covers a reply body that is not valid UTF-8.
+            content = None
+            record["error"] = f"{type(ex).__name__}: {ex}"
+
+        # Time the request itself, not the XML decode.
+        latency_ms = (time.perf_counter() - start) * 1000
+
+        if content is None:
+            record.setdefault("error", "non 200 response")
+        else:
+            try:
+                await status.update_data_from_xml(content)
+                record.update(status.as_dict())
+            except (ValueError, IndexError, TypeError, SyntaxError) as ex:
+                # Malformed or truncated XML from the thermostat.
+                record["error"] = f"decode failed: {ex}"
+
+        record["latency_ms"] = round(latency_ms, 3)
+        record["ok"] = "error" not in record
+
+        self.requests += 1
+        if record["ok"]:
+            self.latencies.append(latency_ms)
+        else:
+            self.errors += 1
+
+        return record
+
+    async def _async_worker(self) -> None:
+        """Poll hosts from the queue until stopped."""
+        loop = asyncio.get_running_loop()
+        while (job := await self._queue.get()) is not None:
+            if self._stop.is_set():
+                return
+
+            host, polls = job
+            try:
+                record = await self._async_poll_once(host)
+            except Exception as ex:  # noqa: BLE001
+                # Keep one misbehaving thermostat from ending the whole run.
+                _LOGGER.exception("Unexpected error polling %s", host)
+                self.requests += 1
+                self.errors += 1
+                record = {
+                    "host": host,
+                    "ts": time.time(),
+                    "error": f"unexpected error: {type(ex).__name__}: {ex}",
+                    "ok": False,
+                }
+            try:
+                self._out.write(json.dumps(record) + "\n")
+                self._out.flush()
+            except BrokenPipeError:
+                # Reader went away (e.g. piped into head), wind down quietly.
+                self.stop()
+                return
+
+            polls += 1
+            if self._count and polls >= self._count:
+                self._active -= 1
+                if not self._active:
+                    self.stop()
+            else:
+                loop.call_later(self._interval, self._requeue, (host, polls))
+
+    async def async_run(self) -> None:
+        """Poll every host until stopped or count is reached."""
+        if not self._hosts:
+            return
+        for host in self._hosts:
+            self._queue.put_nowait((host, 0))
+        await asyncio.gather(*(self._async_worker() for _ in range(self._workers)))
+
+    def summary(self, elapsed: float) -> dict:
+        """Return throughput and latency percentiles for the run.
+
+        Latency percentiles only cover successful requests.
+        """
+        return {
+            "hosts": len(self._hosts),
+            "requests": self.requests,
+            "errors": self.errors,
+            "elapsed_s": round(elapsed, 3),
+            "throughput_rps": round(self.requests / elapsed, 3) if elapsed else 0.0,
+            # Successful requests only, failures are counted in errors.
+            "latency_ms": {
+                "p50": round(percentile(self.latencies, 50), 3),
+                "p90": round(percentile(self.latencies, 90), 3),
+                "p95": round(percentile(self.latencies, 95), 3),
+                "p99": round(percentile(self.latencies, 99), 3),
+                "max": round(max(self.latencies, default=0.0), 3),
+            },
+        }
+
+
+async def async_main(
+    args: argparse.Namespace, hosts: list[str], pollers: list[FleetPoller]
+) -> None:
+    """Run the poller, adding it to pollers so an interrupted run can be summarized."""
+    timeout = ClientTimeout(total=args.timeout)
+
+    async with ClientSession(timeout=timeout) as session:
+        poller = FleetPoller(
+            session, hosts, args.concurrency, args.interval, args.count
+        )
+        pollers.append(poller)
+
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, poller.stop)
+            except (NotImplementedError, RuntimeError):
+                # Not supported on this platform, fall back to Ctrl+C.
+                pass
+
+        await poller.async_run()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse arguments, poll the fleet and print the summary."""
+    parser = argparse.ArgumentParser(
+        prog="python -m custom_components.microair_climate.fleet",
+        description="Poll MicroAir thermostats and stream their state as JSON lines.",
+    )
+    parser.add_argument(
+        "targets", nargs="+", help="thermostat addresses, host:port pairs or CIDRs"
+    )
+    parser.add_argument(
+        "-c", "--concurrency", type=int, default=8, help="number of polling workers"
+    )
+    parser.add_argument(
+        "-i",
+        "--interval",
+        type=float,
+        default=UPDATE_INTERVAL.total_seconds(),
+        help="seconds between polls of each thermostat",
+    )
+    parser.add_argument(
+        "-n",
+        "--count",
+        type=int,
+        default=0,
+        help="polls per thermostat, 0 to run until interrupted",
+    )
+    parser.add_argument(
+        "-t",
+        "--timeout",
+        type=float,
+        default=REQUEST_TIMEOUT,
+        help="per request timeout in seconds",
+    )
+    parser.add_argument("-p", "--port", type=int, help="port to use for all targets")
+    args = parser.parse_args(argv)
+
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    try:
+        hosts = expand_targets(args.targets, args.port)
+    except ValueError as ex:
+        parser.error(str(ex))
+
+    pollers: list[FleetPoller] = []
+    start = time.perf_counter()
+    try:
+        asyncio.run(async_main(args, hosts, pollers))
+    except KeyboardInterrupt:
+        # Ctrl+C where signal handlers are not supported, still a clean stop.
+        pass
+    finally:
+        elapsed = time.perf_counter() - start
+        summary = (
+            pollers[0].summary(elapsed)
+            if pollers
+            else {"hosts": len(hosts), "requests": 0, "errors": 0}
+        )
+        if not _stdout_open():
+            # Keep the interpreter from failing to flush a closed pipe at exit.
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        print(json.dumps(summary), file=sys.stderr)
+
+    # Only a run where every request failed counts as a failure.
+    return 1 if summary["requests"] and summary["errors"] == summary["requests"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Tests for the MicroAir_EasyTouch integration."""
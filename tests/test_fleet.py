@@ -0,0 +1,190 @@
+"""Tests for the headless fleet poller, run against a local stand-in server."""
+
+import asyncio
+import io
+import json
+
+from aiohttp import ClientSession, ClientTimeout, web
+import pytest
+
+from custom_components.microair_climate.coordinator import MicroAirStatus
+from custom_components.microair_climate.fleet import (
+    FleetPoller,
+    expand_targets,
+    main,
+    percentile,
+)
+
+# data0: network id AB, cool mode, fan off, setpoint 0x48, temp 0x46.
+# data1: line voltage 0x384.
+GOOD_XML = (
+    "<R><A>" + "0000AB00000" + "50" + "00" + "0" + "48" + "46" + "</A>"
+    "<B>" + "0000000000" + "0384" + "0000" + "</B></R>"
+)
+
+
+def _stand_in_handler(reply: str | bytes | None):
+    """Return a /ShortStatus handler giving reply, or a 500 for None."""
+
+    async def handler(request: web.Request) -> web.StreamResponse:
+        if reply is None:
+            raise web.HTTPInternalServerError
+        if isinstance(reply, bytes):
+            return web.Response(body=reply)
+        return web.Response(text=reply)
+
+    return handler
+
+
+async def _async_start_stand_in(replies: dict[str, str | bytes | None]):
+    """Serve /ShortStatus on 127.0.0.1, one reply per named site."""
+    runners, hosts = [], {}
+    for name, reply in replies.items():
+        app = web.Application()
+        app.router.add_post("/ShortStatus", _stand_in_handler(reply))
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        runners.append(runner)
+        hosts[name] = "127.0.0.1:%d" % runner.addresses[0][1]
+    return runners, hosts
+
+
+async def _async_poll(replies, count=2, extra_hosts=()):
+    """Poll the stand-in and return the parsed records and summary."""
+    runners, hosts = await _async_start_stand_in(replies)
+    out = io.StringIO()
+    try:
+        async with ClientSession(timeout=ClientTimeout(total=2)) as session:
+            poller = FleetPoller(
+                session, [*hosts.values(), *extra_hosts], 2, 0.01, count, out=out
+            )
+            await poller.async_run()
+            summary = poller.summary(1.0)
+    finally:
+        for runner in runners:
+            await runner.cleanup()
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    return hosts, records, summary
+
+
+def test_expand_targets() -> None:
+    """Test addresses, host:port pairs and CIDR blocks expand correctly."""
+    assert expand_targets(["10.0.0.0/30", "1.2.3.4:81", "host.local"], 8080) == [
+        "10.0.0.1:8080",
+        "10.0.0.2:8080",
+        "1.2.3.4:81",
+        "host.local:8080",
+    ]
+    assert expand_targets(["fe80::1", "::1/127", "[::1]:9000"], 8080) == [
+        "[fe80::1]:8080",
+        "[::]:8080",
+        "[::1]:8080",
+        "[::1]:9000",
+    ]
+    assert expand_targets(["fe80::1", "1.2.3.4"]) == ["[fe80::1]", "1.2.3.4"]
+
+
+@pytest.mark.parametrize(
+    "target",
+    [
+        "10.0.0.0/8",
+        "fd00::/64",
+        "1.2.3.4:x",
+        "1.2.3.4:70000",
+        "[zz]:80",
+        "fe80::1%eth0",
+        "[fe80::1%eth0]:80",
+    ],
+)
+def test_expand_targets_invalid(target: str) -> None:
+    """Test oversized blocks and malformed targets are refused."""
+    with pytest.raises(ValueError):
+        expand_targets([target])
+
+
+def test_percentile() -> None:
+    """Test nearest-rank percentiles."""
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([3.0], 90) == 3
+    assert percentile([], 50) == 0
+
+
+def test_poll_decodes_state() -> None:
+    """Test good replies are decoded and counted in the summary."""
+    hosts, records, summary = asyncio.run(_async_poll({"good": GOOD_XML}))
+
+    assert len(records) == 2
+    record = records[0]
+    assert record["ok"]
+    assert record["host"] == hosts["good"]
+    assert record["hvac_mode"] == "cool"
+    assert record["setpoint"] == 0x48
+    assert record["indoor_temp"] == 0x46
+    assert record["line_voltage"] == 0x384
+    assert record["network_id"] == "AB"
+    assert record["latency_ms"] >= 0
+
+    assert summary["hosts"] == 1
+    assert summary["requests"] == 2
+    assert summary["errors"] == 0
+    assert summary["latency_ms"]["max"] >= summary["latency_ms"]["p50"]
+
+
+def test_poll_records_errors() -> None:
+    """Test failed requests are recorded as errors and left out of latency."""
+    hosts, records, summary = asyncio.run(
+        _async_poll(
+            {
+                "bad_status": None,
+                "bad_xml": "not xml",
+                "empty": "<R><A/><B/></R>",
+                "not_utf8": b"\xff\xfe<R>",
+            },
+            count=1,
+            extra_hosts=["127.0.0.1:1"],
+        )
+    )
+
+    by_host = {record["host"]: record for record in records}
+    assert len(by_host) == 5
+    assert not any(record["ok"] for record in records)
+    assert by_host[hosts["bad_status"]]["error"] == "non 200 response"
+    assert by_host[hosts["bad_xml"]]["error"].startswith("decode failed")
+    assert by_host[hosts["empty"]]["error"].startswith("decode failed")
+    assert by_host[hosts["not_utf8"]]["error"].startswith("UnicodeDecodeError")
+    assert by_host["127.0.0.1:1"]["error"].startswith("ClientConnectorError")
+
+    assert summary["requests"] == 5
+    assert summary["errors"] == 5
+    assert summary["latency_ms"]["p50"] == 0
+
+
+def test_poll_survives_unexpected_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test an unexpected exception is recorded and polling carries on."""
+
+    async def broken_update(self, x):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(MicroAirStatus, "update_data_from_xml", broken_update)
+    _, records, summary = asyncio.run(_async_poll({"good": GOOD_XML}, count=2))
+
+    assert len(records) == 2
+    assert records[0]["error"] == "unexpected error: RuntimeError: boom"
+    assert summary["requests"] == 2
+    assert summary["errors"] == 2
+
+
+@pytest.mark.parametrize(
+    ("argv", "expected"), [(["127.0.0.1:1", "-n", "1"], 1), (["fd00::/64"], 2)]
+)
+def test_main_exit_code(argv: list[str], expected: int) -> None:
+    """Test a run where every request failed, and bad targets, exit non-zero."""
+    try:
+        assert main(argv) == expected
+    except SystemExit as ex:
+        assert ex.code == expected